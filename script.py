@@ -1,106 +1,460 @@
 import os
 import json
+import math
+import heapq
+import bisect
+import itertools
 import datetime
-import flet as ft
 from collections import defaultdict
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import flet as ft
+
+try:
+    import orjson
+except ImportError:  # optional, the standard library json is used instead
+    orjson = None
+
+np = None  # NumPy, imported by _get_reduce on first use
+
+PERIODS = ("day", "week", "month", "year")
+FSYNC_BATCH = 32  # appended records between fsync calls
+VECTORIZE_THRESHOLD = 2000  # records above which running totals are rebuilt from arrays
+
+# Which record lists get_transactions reads for each transaction type
+_TX_INCOME = 1
+_TX_EXPENSES = 2
+_TX_MASK = {"all": _TX_INCOME | _TX_EXPENSES, "income": _TX_INCOME, "expenses": _TX_EXPENSES}
+
+# Sort keys
+_date_key = itemgetter("date_i")  # stored records
+_amt_key = itemgetter(1)  # (category, amount) pairs
+
+
+def _dumps(record):
+    """Serialize a record to a single JSON line (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+def _loads(raw):
+    """Parse JSON from bytes"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            # orjson rejects the NaN/Infinity the standard library json may have written
+            pass
+    return json.loads(raw)
+
+
+def _reduce_vectorized(amounts, dates, cats, start, n_cats):
+    """Sum and count the amounts dated on or after start, in total and per category id"""
+    mask = dates >= start
+    selected = amounts[mask]
+    selected_cats = cats[mask]
+    sums = np.bincount(selected_cats, weights=selected, minlength=n_cats)
+    counts = np.bincount(selected_cats, minlength=n_cats)
+    return selected.sum(), sums, counts
+
+
+def _reduce_loop(amounts, dates, cats, start, n_cats):
+    """Single-pass version of _reduce_vectorized for compiling with Numba"""
+    total = 0.0
+    sums = np.zeros(n_cats)
+    counts = np.zeros(n_cats, np.int64)
+    for i in range(amounts.size):
+        if dates[i] >= start:
+            amount = amounts[i]
+            total += amount
+            sums[cats[i]] += amount
+            counts[cats[i]] += 1
+    return total, sums, counts
+
+
+_reduce = None  # chosen by _get_reduce on first use (False without NumPy), the imports cost more than most sessions save
+
+
+def _get_reduce():
+    """Import NumPy and compile _reduce_loop with Numba on first use, return None if NumPy is missing"""
+    global np, _reduce
+    if _reduce is None:
+        try:
+            import numpy
+        except ImportError:  # optional, running totals are then always rebuilt with a plain Python loop
+            _reduce = False
+            return None
+        np = numpy
+        try:
+            from numba import njit
+        except ImportError:  # optional, NumPy's vectorized bincount is used instead
+            _reduce = _reduce_vectorized
+        else:
+            _reduce = njit(cache=True)(_reduce_loop)
+    return _reduce or None
+
+
+def _parse_date(date):
+    """Parse a YYYY-MM-DD string into its canonical form and an integer YYYYMMDD that orders the same way"""
+    parsed = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+    return parsed.isoformat(), _day_to_int(parsed)
+
+
+def _parse_amount(amount):
+    """Convert an amount to float, rejecting inf and nan, which JSON cannot store"""
+    amount = float(amount)
+    if not math.isfinite(amount):
+        raise ValueError(f"Amount must be a finite number, got {amount}")
+    return amount
+
+
+def _day_to_int(day):
+    """Convert a date object to an integer YYYYMMDD"""
+    return day.year * 10000 + day.month * 100 + day.day
 
 
 class BudgetManager:
     def __init__(self, filename="budget_data.json"):
+        # filename is the legacy JSON file; records now live in one append-only JSONL file per kind
         self.filename = filename
-        self.data = self._load_data()
+        base = os.path.splitext(filename)[0]
+        self.record_files = {
+            "income": base + "_income.jsonl",
+            "expenses": base + "_expenses.jsonl",
+        }
         self.categories = set(["Groceries", "Housing", "Transportation", "Entertainment", "Utilities",
                                "Healthcare", "Savings", "Debt", "Personal", "Miscellaneous"])
+        self._sorted_categories = sorted(self.categories)
+
+        # Category name <-> integer id, expenses are kept in memory with the id only
+        self._cat_id = {}
+        self._cat_names = []
+        for category in self._sorted_categories:
+            self._intern_category(category)
+
+        # Records are loaded on first access to self.data, the JSONL files are opened on first append
+        self._data = None
+        self._files = None
+        self._pending_writes = 0
+        self._version = 0
+        self._summary_cache = {}
+
+        # Running totals per period, keyed by None (all time) and the PERIODS labels
+        self._buckets = {}
+        self._period_starts = {}
+        self._period_starts_day = None
+
+    @property
+    def data(self):
+        """Income and expense records, loaded from disk on first access"""
+        if self._data is None:
+            self._data = self._load_data()
+        return self._data
 
     def _load_data(self):
-        """Load budget data from file or create new data structure"""
+        """Load budget data from the JSONL files, migrating the legacy JSON file on first run"""
+        if not any(os.path.exists(path) for path in self.record_files.values()):
+            data = self._load_legacy_data()
+            for kind, path in self.record_files.items():
+                self._upgrade_records(data[kind])
+                self._write_records(path, data[kind])
+            return self._intern_records(data)
+
+        data = {}
+        for kind, path in self.record_files.items():
+            data[kind], clean = self._read_records(path)
+            # Rewrite upgraded files and torn endings so the next append does not land on a partial record
+            if self._upgrade_records(data[kind]) or not clean:
+                self._write_records(path, data[kind])
+        return self._intern_records(data)
+
+    def _intern_records(self, data):
+        """Replace the category names of loaded expenses with their ids"""
+        for item in data["expenses"]:
+            item["cat_id"] = self._intern_category(item.pop("category"))
+        return data
+
+    def _to_disk(self, kind, item):
+        """Convert an in-memory record to its stored form (cat_id -> category name)"""
+        if kind != "expenses":
+            return item
+        item = dict(item)
+        item["category"] = self._cat_names[item.pop("cat_id")]
+        return item
+
+    @staticmethod
+    def _upgrade_records(records):
+        """Add the integer date to records saved by older versions, return True if any changed"""
+        changed = False
+        for record in records:
+            if "date_i" not in record:
+                try:
+                    _, record["date_i"] = _parse_date(record["date"])
+                except ValueError:
+                    record["date_i"] = 0
+                changed = True
+        return changed
+
+    def _load_legacy_data(self):
+        """Load budget data from the old single JSON file"""
         if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r') as file:
-                    return json.load(file)
-            except json.JSONDecodeError:
-                return {"income": [], "expenses": []}
+            # Raise rather than migrate an empty dataset, which would hide the old file for good
+            with open(self.filename, 'rb') as file:
+                try:
+                    return _loads(file.read())
+                except ValueError as error:
+                    raise ValueError(f"Could not read budget data from {self.filename}: {error}") from error
         return {"income": [], "expenses": []}
 
-    def _save_data(self):
-        """Save budget data to file"""
-        with open(self.filename, 'w') as file:
-            json.dump(self.data, file, indent=4)
+    @staticmethod
+    def _read_records(path):
+        """Read one record per line, return the records and False if the last append was torn"""
+        records = []
+        clean = True
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                lines = file.read().split(b"\n")
+
+            # Every complete record ends with a newline, so only text after the last one can be torn
+            tail = lines.pop()
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(_loads(line))
+                except ValueError as error:
+                    raise ValueError(f"Could not read record {number} of {path}: {error}") from error
+
+            if tail.strip():
+                clean = False
+                try:
+                    records.append(_loads(tail))
+                except ValueError:
+                    pass
+        return records, clean
+
+    @staticmethod
+    def _write_records(path, records):
+        """Atomically replace a JSONL file with the given records"""
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(b"".join(_dumps(record) for record in records))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    def _save_record(self, kind, item):
+        """Append a single record to its JSONL file, opening the files if needed"""
+        if self._files is None:
+            self._files = {kind: open(path, 'ab', buffering=0) for kind, path in self.record_files.items()}
+        self._files[kind].write(_dumps(self._to_disk(kind, item)))
+        self._version += 1
+        self._summary_cache.clear()
+        self._pending_writes += 1
+        if self._pending_writes >= FSYNC_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Force appended records to disk"""
+        if self._files is None:
+            return
+        for file in self._files.values():
+            file.flush()
+            os.fsync(file.fileno())
+        self._pending_writes = 0
+
+    def compact(self):
+        """Rewrite the JSONL files from the records currently in memory"""
+        data = self.data
+        self.close()
+        for kind, path in self.record_files.items():
+            self._write_records(path, [self._to_disk(kind, item) for item in data[kind]])
+
+    def close(self):
+        """Flush pending records and close the JSONL files, a later add reopens them"""
+        if self._files is None:
+            return
+        self.flush()
+        for file in self._files.values():
+            file.close()
+        self._files = None
 
     def add_income(self, amount, source, date=None):
-        """Add income to budget"""
+        """Add income to budget and return the updated all-time totals"""
         if date is None:
             date = datetime.datetime.now().strftime("%Y-%m-%d")
+        amount = _parse_amount(amount)
+        date, date_i = _parse_date(date)
+        self._refresh_periods()
 
-        self.data["income"].append({
-            "amount": float(amount),
+        item = {
+            "amount": amount,
             "source": source,
-            "date": date
-        })
-        self._save_data()
-        return True
+            "date": date,
+            "date_i": date_i
+        }
+        # Write first so a failed write leaves the in-memory state untouched
+        self._save_record("income", item)
+        self.data["income"].append(item)
+        self._add_to_buckets("income", item)
+        return self._totals()
 
     def add_expense(self, amount, category, description, date=None):
-        """Add expense to budget"""
+        """Add expense to budget and return the updated all-time totals"""
         if date is None:
             date = datetime.datetime.now().strftime("%Y-%m-%d")
+        amount = _parse_amount(amount)
+        date, date_i = _parse_date(date)
+        self._refresh_periods()
 
+        cat_id = self._intern_category(category)
+
+        item = {
+            "amount": amount,
+            "cat_id": cat_id,
+            "description": description,
+            "date": date,
+            "date_i": date_i
+        }
+        # Write first so a failed write leaves the in-memory state untouched
+        self._save_record("expenses", item)
         if category not in self.categories:
             self.categories.add(category)
+            bisect.insort(self._sorted_categories, category)
+        self.data["expenses"].append(item)
+        self._add_to_buckets("expenses", item, cat_id)
+        return self._totals()
+
+    def _totals(self):
+        """Get the all-time totals from the running aggregates"""
+        bucket = self._buckets[None]
+        return {
+            "total_income": bucket["income"],
+            "total_expenses": bucket["expenses"],
+            "balance": bucket["income"] - bucket["expenses"]
+        }
 
-        self.data["expenses"].append({
-            "amount": float(amount),
-            "category": category,
-            "description": description,
-            "date": date
-        })
-        self._save_data()
-        return True
+    def get_categories(self):
+        """Get the expense categories in alphabetical order"""
+        return self._sorted_categories
 
     def get_summary(self, period=None):
         """Get summary of budget for specified period (default: all time)"""
-        income = self._filter_by_period(self.data["income"], period)
-        expenses = self._filter_by_period(self.data["expenses"], period)
-
-        total_income = sum(item["amount"] for item in income)
-        total_expenses = sum(item["amount"] for item in expenses)
+        self._refresh_periods()
+        if period not in self._buckets:
+            # "all" and unknown periods share the all-time cache entry
+            period = None
+        key = (period, self._version)
+        if key in self._summary_cache:
+            return self._summary_cache[key]
+
+        bucket = self._buckets[period]
+        total_income = bucket["income"]
+        total_expenses = bucket["expenses"]
         balance = total_income - total_expenses
 
-        # Calculate expenses by category
-        expenses_by_category = defaultdict(float)
-        for expense in expenses:
-            expenses_by_category[expense["category"]] += expense["amount"]
-
-        return {
+        summary = {
             "total_income": total_income,
             "total_expenses": total_expenses,
             "balance": balance,
-            "expenses_by_category": dict(expenses_by_category)
+            "expenses_by_category": {
+                self._cat_names[cat_id]: amount for cat_id, amount in bucket["categories"].items()
+            }
         }
+        self._summary_cache[key] = summary
+        return summary
+
+    def _refresh_periods(self):
+        """Recompute period start dates and rebuild the running totals when the day changes"""
+        today = datetime.date.today()
+        today_day = today.toordinal()
+        if today_day == self._period_starts_day:
+            return
+
+        self._period_starts_day = today_day
+        self._period_starts = {period: self._period_start(period, today) for period in PERIODS}
+        self._buckets = {
+            period: {"income": 0.0, "expenses": 0.0, "categories": defaultdict(float)}
+            for period in (None,) + PERIODS
+        }
+        reduced = len(self.data["income"]) + len(self.data["expenses"]) > VECTORIZE_THRESHOLD and self._reduce_buckets()
+        if not reduced:
+            for item in self.data["income"]:
+                self._add_to_buckets("income", item)
+            for item in self.data["expenses"]:
+                self._add_to_buckets("expenses", item, item["cat_id"])
+        self._summary_cache.clear()
+
+    def _reduce_buckets(self):
+        """Fill the empty period buckets from column arrays of the records, return False if NumPy is missing"""
+        reduce = _get_reduce()
+        if reduce is None:
+            return False
+        for kind in ("income", "expenses"):
+            amounts, dates, cats = self._record_arrays(kind)
+            n_cats = len(self._cat_names) if kind == "expenses" else 1
+            for period, bucket in self._buckets.items():
+                start = 0 if period is None else self._period_starts[period]
+                total, sums, counts = reduce(amounts, dates, cats, start, n_cats)
+                bucket[kind] = float(total)
+                if kind == "expenses":
+                    # Every category with a record in the period is listed, even if it sums to 0
+                    for cat_id in np.flatnonzero(counts):
+                        bucket["categories"][int(cat_id)] = float(sums[cat_id])
+        return True
 
-    def _filter_by_period(self, items, period):
-        """Filter items by time period"""
-        if period is None:
-            return items
-
-        today = datetime.datetime.now()
-
+    def _record_arrays(self, kind):
+        """Get the amounts, integer dates and category ids of a kind of record as NumPy arrays"""
+        records = self.data[kind]
+        count = len(records)
+        amounts = np.fromiter((item["amount"] for item in records), np.float64, count)
+        dates = np.fromiter((item["date_i"] for item in records), np.int32, count)
+        if kind == "expenses":
+            cats = np.fromiter((item["cat_id"] for item in records), np.int16, count)
+        else:
+            cats = np.zeros(count, np.int16)
+        return amounts, dates, cats
+
+    def _intern_category(self, category):
+        """Get the integer id of a category name, assigning a new one if needed"""
+        cat_id = self._cat_id.get(category)
+        if cat_id is None:
+            cat_id = self._cat_id[category] = len(self._cat_names)
+            self._cat_names.append(category)
+        return cat_id
+
+    def _add_to_buckets(self, kind, item, cat_id=None):
+        """Add a single income or expense record to every period it falls into"""
+        amount = item["amount"]
+        for period, bucket in self._buckets.items():
+            if period is not None and item["date_i"] < self._period_starts[period]:
+                continue
+            bucket[kind] += amount
+            if cat_id is not None:
+                bucket["categories"][cat_id] += amount
+
+    @staticmethod
+    def _period_start(period, today):
+        """Get the first date (integer YYYYMMDD) of a time period"""
         if period == "day":
-            start_date = today.strftime("%Y-%m-%d")
+            start = today
         elif period == "week":
-            start_date = (today - datetime.timedelta(days=today.weekday())).strftime("%Y-%m-%d")
+            start = today - datetime.timedelta(days=today.weekday())
         elif period == "month":
-            start_date = today.replace(day=1).strftime("%Y-%m-%d")
+            start = today.replace(day=1)
         elif period == "year":
-            start_date = today.replace(month=1, day=1).strftime("%Y-%m-%d")
+            start = today.replace(month=1, day=1)
         else:
-            return items
+            return None
+        return _day_to_int(start)
 
-        return [item for item in items if item["date"] >= start_date]
-
-    def get_spending_advice(self):
-        """Provide basic spending advice based on budget"""
-        summary = self.get_summary()
+    def get_spending_advice(self, summary=None):
+        """Provide basic spending advice based on budget (default: all-time summary)"""
+        if summary is None:
+            summary = self.get_summary()
         advice = []
 
         # If spending more than earning
@@ -109,7 +463,7 @@ class BudgetManager:
 
             # Find top expense categories
             categories = sorted(summary["expenses_by_category"].items(),
-                                key=lambda x: x[1], reverse=True)
+                                key=_amt_key, reverse=True)
 
             if categories:
                 top_category = categories[0][0]
@@ -124,32 +478,42 @@ class BudgetManager:
 
     def get_transactions(self, transaction_type="all", limit=10):
         """Get recent transactions"""
-        transactions = []
+        income = []
+        expenses = []
+        mask = _TX_MASK.get(transaction_type, 0)
 
-        if transaction_type == "income" or transaction_type == "all":
-            for item in sorted(self.data["income"], key=lambda x: x["date"], reverse=True)[:limit]:
+        if mask & _TX_INCOME:
+            income = heapq.nlargest(limit, self.data["income"], key=_date_key)
+        if mask & _TX_EXPENSES:
+            expenses = heapq.nlargest(limit, self.data["expenses"], key=_date_key)
+
+        # Both lists are already newest first by date_i, so merging on the same key keeps that order
+        transactions = []
+        for item in itertools.islice(heapq.merge(income, expenses, key=_date_key, reverse=True), limit):
+            if "cat_id" in item:
                 transactions.append({
-                    "type": "Income",
+                    "type": "Expense",
                     "date": item['date'],
                     "amount": item['amount'],
-                    "category": item['source'],
-                    "description": item['source']
+                    "category": self._cat_names[item['cat_id']],
+                    "description": item['description']
                 })
-
-        if transaction_type == "expenses" or transaction_type == "all":
-            for item in sorted(self.data["expenses"], key=lambda x: x["date"], reverse=True)[:limit]:
+            else:
                 transactions.append({
-                    "type": "Expense",
+                    "type": "Income",
                     "date": item['date'],
                     "amount": item['amount'],
-                    "category": item['category'],
-                    "description": item['description']
+                    "category": item['source'],
+                    "description": item['source']
                 })
 
-        return sorted(transactions, key=lambda x: x["date"], reverse=True)[:limit]
+        return transactions
 
 
-def main(page: ft.Page):
+def main(page: "ft.Page"):
+    # Imported here so BudgetManager can be used without loading Flet
+    import flet as ft
+
     # Initialize budget manager
     budget = BudgetManager()
 
@@ -188,49 +552,70 @@ def main(page: ft.Page):
     income_text = ft.Text("Total Income: $0.00", size=18)
     expenses_text = ft.Text("Total Expenses: $0.00", size=18)
     balance_text = ft.Text("Balance: $0.00", size=18, weight=ft.FontWeight.BOLD)
-    category_container = ft.Column(spacing=10)
+    category_container = ft.Column([
+        ft.Text("Expense Breakdown by Category:", size=18, weight=ft.FontWeight.BOLD)
+    ], spacing=10)
+    category_rows = []  # reused between refreshes, rows past the current categories are hidden
 
-    def update_dashboard():
-        summary = budget.get_summary(summary_period_dropdown.value)
-        income_text.value = f"Total Income: ${summary['total_income']:.2f}"
-        expenses_text.value = f"Total Expenses: ${summary['total_expenses']:.2f}"
+    last_dashboard_key = None
+
+    def show_totals(totals):
+        income_text.value = f"Total Income: ${totals['total_income']:.2f}"
+        expenses_text.value = f"Total Expenses: ${totals['total_expenses']:.2f}"
 
         # Update balance with color
-        balance = summary['balance']
+        balance = totals['balance']
         balance_text.value = f"Balance: ${balance:.2f}"
         balance_text.color = ft.colors.GREEN if balance >= 0 else ft.colors.RED
 
-        # Clear and update category breakdown
-        category_container.controls.clear()
-
-        # Add header
-        category_container.controls.append(
-            ft.Text("Expense Breakdown by Category:", size=18, weight=ft.FontWeight.BOLD)
-        )
+    def update_dashboard(defer=False):
+        nonlocal last_dashboard_key
+        summary = budget.get_summary(summary_period_dropdown.value)
 
         # Sort categories by amount
         sorted_categories = sorted(
             summary['expenses_by_category'].items(),
-            key=lambda x: x[1],
+            key=_amt_key,
             reverse=True
         )
 
-        # Calculate percentages and add category rows
-        for category, amount in sorted_categories:
+        # Skip the rebuild when nothing shown on the dashboard has changed
+        dashboard_key = (summary['total_income'], summary['total_expenses'], tuple(sorted_categories))
+        if dashboard_key == last_dashboard_key:
+            return
+        last_dashboard_key = dashboard_key
+
+        show_totals(summary)
+
+        # Add rows only when there are more categories than ever shown before
+        while len(category_rows) < len(sorted_categories):
+            category_row = ft.Row([
+                ft.Text(width=150),
+                ft.Text(width=100),
+                ft.Text(width=80),
+                ft.ProgressBar(width=200, color=ft.colors.BLUE),
+            ], alignment=ft.MainAxisAlignment.START)
+            category_rows.append(category_row)
+            category_container.controls.append(category_row)
+
+        # Calculate percentages and fill in category rows
+        for category_row, (category, amount) in zip(category_rows, sorted_categories):
             percentage = 0
             if summary['total_expenses'] > 0:
                 percentage = (amount / summary['total_expenses'] * 100)
 
-            category_row = ft.Row([
-                ft.Text(f"{category}:", width=150),
-                ft.Text(f"${amount:.2f}", width=100),
-                ft.Text(f"({percentage:.1f}%)", width=80),
-                ft.ProgressBar(value=percentage / 100, width=200, color=ft.colors.BLUE),
-            ], alignment=ft.MainAxisAlignment.START)
+            name_text, amount_text, percentage_text, progress_bar = category_row.controls
+            name_text.value = f"{category}:"
+            amount_text.value = f"${amount:.2f}"
+            percentage_text.value = f"({percentage:.1f}%)"
+            progress_bar.value = percentage / 100
+            category_row.visible = True
 
-            category_container.controls.append(category_row)
+        for category_row in category_rows[len(sorted_categories):]:
+            category_row.visible = False
 
-        page.update()
+        if not defer:
+            page.update()
 
     summary_period_dropdown.on_change = lambda _: update_dashboard()
 
@@ -269,6 +654,7 @@ def main(page: ft.Page):
     income_status_text = ft.Text("", color=ft.colors.GREEN)
 
     def add_income_clicked(_):
+        nonlocal last_dashboard_key
         try:
             amount = float(income_amount_field.value)
             source = income_source_field.value
@@ -281,7 +667,7 @@ def main(page: ft.Page):
                 income_status_text.value = "Amount must be greater than zero"
                 income_status_text.color = ft.colors.RED
             else:
-                budget.add_income(amount, source, date)
+                totals = budget.add_income(amount, source, date)
                 income_status_text.value = f"Income of ${amount:.2f} added successfully!"
                 income_status_text.color = ft.colors.GREEN
 
@@ -290,11 +676,18 @@ def main(page: ft.Page):
                 income_source_field.value = ""
                 income_date_field.value = datetime.datetime.now().strftime("%Y-%m-%d")
 
-                # Update dashboard
-                update_dashboard()
-                update_transactions()
+                # Income leaves the category breakdown alone, so the all-time view only needs the new totals
+                if summary_period_dropdown.value == "all":
+                    show_totals(totals)
+                    last_dashboard_key = None
+                else:
+                    update_dashboard(defer=True)
+
+                # Refresh the other tabs without redrawing, the page is updated once below
+                update_transactions(defer=True)
+                update_advice(defer=True)
         except ValueError:
-            income_status_text.value = "Invalid amount. Please enter a number."
+            income_status_text.value = "Invalid amount or date. Please enter a number and a YYYY-MM-DD date."
             income_status_text.color = ft.colors.RED
 
         page.update()
@@ -328,7 +721,7 @@ def main(page: ft.Page):
 
     expense_category_dropdown = ft.Dropdown(
         label="Category",
-        options=[ft.dropdown.Option(cat) for cat in sorted(budget.categories)],
+        options=[ft.dropdown.Option(cat) for cat in budget.get_categories()],
         width=300,
     )
 
@@ -372,11 +765,12 @@ def main(page: ft.Page):
                 expense_description_field.value = ""
                 expense_date_field.value = datetime.datetime.now().strftime("%Y-%m-%d")
 
-                # Update dashboard
-                update_dashboard()
-                update_transactions()
+                # Refresh the other tabs without redrawing, the page is updated once below
+                update_dashboard(defer=True)
+                update_transactions(defer=True)
+                update_advice(defer=True)
         except ValueError:
-            expense_status_text.value = "Invalid amount. Please enter a number."
+            expense_status_text.value = "Invalid amount or date. Please enter a number and a YYYY-MM-DD date."
             expense_status_text.color = ft.colors.RED
 
         page.update()
@@ -427,34 +821,48 @@ def main(page: ft.Page):
         horizontal_lines=ft.border.BorderSide(1, ft.colors.GREY_400),
         column_spacing=5,
     )
+    transaction_rows = []  # reused between refreshes
+
+    last_transactions_key = None
+
+    def update_transactions(defer=False):
+        nonlocal last_transactions_key
 
-    def update_transactions():
         # Get transactions
         transactions = budget.get_transactions(
             transaction_type=transactions_dropdown.value,
             limit=20
         )
 
-        # Clear table
-        transactions_table.rows.clear()
+        # Skip the rebuild when the table would show the same rows
+        transactions_key = tuple(tuple(transaction.values()) for transaction in transactions)
+        if transactions_key == last_transactions_key:
+            return
+        last_transactions_key = transactions_key
+
+        # Add rows only when there are more transactions than ever shown before
+        while len(transaction_rows) < len(transactions):
+            transaction_rows.append(ft.DataRow(cells=[ft.DataCell(ft.Text()) for _ in range(5)]))
 
-        # Add rows
-        for transaction in transactions:
+        # Fill in rows
+        for transaction_row, transaction in zip(transaction_rows, transactions):
             color = ft.colors.GREEN if transaction["type"] == "Income" else ft.colors.RED
 
-            transactions_table.rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(transaction["type"], color=color)),
-                        ft.DataCell(ft.Text(transaction["date"])),
-                        ft.DataCell(ft.Text(f"${transaction['amount']:.2f}", color=color)),
-                        ft.DataCell(ft.Text(transaction["category"])),
-                        ft.DataCell(ft.Text(transaction["description"])),
-                    ]
-                )
+            type_text, date_text, amount_text, category_text, description_text = (
+                cell.content for cell in transaction_row.cells
             )
+            type_text.value = transaction["type"]
+            type_text.color = color
+            date_text.value = transaction["date"]
+            amount_text.value = f"${transaction['amount']:.2f}"
+            amount_text.color = color
+            category_text.value = transaction["category"]
+            description_text.value = transaction["description"]
 
-        page.update()
+        transactions_table.rows = transaction_rows[:len(transactions)]
+
+        if not defer:
+            page.update()
 
     transactions_dropdown.on_change = lambda _: update_transactions()
 
@@ -470,9 +878,18 @@ def main(page: ft.Page):
     # ---- ADVICE TAB ----
     advice_container = ft.Column(spacing=10)
 
-    def update_advice():
+    last_advice_key = None
+
+    def update_advice(defer=False):
+        nonlocal last_advice_key
         advice_list = budget.get_spending_advice()
 
+        # Skip the rebuild when the advice has not changed
+        advice_key = tuple(advice_list)
+        if advice_key == last_advice_key:
+            return
+        last_advice_key = advice_key
+
         # Clear container
         advice_container.controls.clear()
 
@@ -487,7 +904,8 @@ def main(page: ft.Page):
                 )
             )
 
-        page.update()
+        if not defer:
+            page.update()
 
     advice_view = ft.Column([
         ft.Container(height=20),
@@ -542,4 +960,6 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    import flet
+
+    flet.app(target=main)
\ No newline at end of file
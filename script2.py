@@ -1,8 +1,23 @@
 import os
+import sys
 import time
 import math
+from functools import lru_cache
 os.environ['TERM'] = 'xterm'
 
+
+def _render(lines):
+    """Write a whole screen of lines to the console with a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+@lru_cache(maxsize=None)
+def _annuity_factor(monthly_rate, total_periods):
+    """Future value of paying 1 every period: ((1 + r)^n - 1) / r"""
+    return ((1 + monthly_rate) ** total_periods - 1) / monthly_rate
+
+
 class BudgetPlanner:
     def __init__(self):
         self.income = 0
@@ -62,11 +77,13 @@ class BudgetPlanner:
 
                 future_value = self.calculate_investment_growth(principal, annual_rate, years)
 
-                print(f"\nInitial Investment: ${principal:.2f}")
-                print(f"Annual Interest Rate: {annual_rate * 100:.2f}%")
-                print(f"Investment Period: {years} years")
-                print(f"Projected Future Value: ${future_value:.2f}")
-                print(f"Total Growth: ${future_value - principal:.2f}")
+                _render([
+                    f"\nInitial Investment: ${principal:.2f}",
+                    f"Annual Interest Rate: {annual_rate * 100:.2f}%",
+                    f"Investment Period: {years} years",
+                    f"Projected Future Value: ${future_value:.2f}",
+                    f"Total Growth: ${future_value - principal:.2f}",
+                ])
 
                 input("\nPress Enter to continue...")
                 break
@@ -89,6 +106,27 @@ class BudgetPlanner:
         future_value = principal * ((1 + annual_rate) ** years)
         return future_value
 
+    def calculate_growth_schedule(self, principal, annual_rate, years):
+        """
+        Calculate the value of an investment at the end of every year.
+
+        Args:
+            principal (float): Initial investment amount
+            annual_rate (float): Annual interest rate (in decimal)
+            years (int): Number of years to invest
+
+        Returns:
+            list: Values (floats) after 0, 1, ..., years years
+        """
+        # Imported here so the CLI does not pay for NumPy at startup
+        try:
+            import numpy as np
+        except ImportError:  # optional, the schedule is then computed one year at a time
+            pass
+        else:
+            return (principal * np.power(1 + annual_rate, np.arange(years + 1))).tolist()
+        return [principal * (1 + annual_rate) ** year for year in range(years + 1)]
+
     def calculate_required_monthly_investment(self, target_amount, years, annual_rate):
         """
         Calculate monthly investment required to reach a savings goal.
@@ -117,7 +155,7 @@ class BudgetPlanner:
             # If interest rate is 0, simple division
             monthly_investment = target_amount / (years * 12)
         else:
-            monthly_investment = target_amount / (((1 + monthly_rate) ** total_periods - 1) / monthly_rate)
+            monthly_investment = target_amount / _annuity_factor(monthly_rate, total_periods)
 
         return monthly_investment
 
@@ -158,14 +196,6 @@ class BudgetPlanner:
                         'monthly_investment_required': monthly_investment
                     }
 
-                    # Display results
-                    print("\n--- Savings Goal Analysis ---")
-                    print(f"Goal: {goal_name}")
-                    print(f"Target Amount: ${target_amount:.2f}")
-                    print(f"Time Frame: {years} years")
-                    print(f"Annual Interest Rate: {annual_rate * 100:.2f}%")
-                    print(f"Monthly Investment Required: ${monthly_investment:.2f}")
-
                     # Project final amount
                     total_contributions = monthly_investment * (years * 12)
                     projected_final_amount = self.calculate_investment_growth(
@@ -174,8 +204,17 @@ class BudgetPlanner:
                         years
                     )
 
-                    print(f"Total Contributions: ${total_contributions:.2f}")
-                    print(f"Projected Final Amount: ${projected_final_amount:.2f}")
+                    # Display results
+                    _render([
+                        "\n--- Savings Goal Analysis ---",
+                        f"Goal: {goal_name}",
+                        f"Target Amount: ${target_amount:.2f}",
+                        f"Time Frame: {years} years",
+                        f"Annual Interest Rate: {annual_rate * 100:.2f}%",
+                        f"Monthly Investment Required: ${monthly_investment:.2f}",
+                        f"Total Contributions: ${total_contributions:.2f}",
+                        f"Projected Final Amount: ${projected_final_amount:.2f}",
+                    ])
 
                     input("\nPress Enter to continue...")
                     break
@@ -185,40 +224,45 @@ class BudgetPlanner:
     def view_savings_goals(self):
         """View and track existing savings goals."""
         self.clear_screen()
-        print("=== SAVINGS GOALS OVERVIEW ===")
 
         if not self.savings_goals:
-            print("No savings goals have been set.")
+            _render(["=== SAVINGS GOALS OVERVIEW ===", "No savings goals have been set."])
             input("\nPress Enter to continue...")
             return
 
+        # One string per goal, joined once by _render
+        out = ["=== SAVINGS GOALS OVERVIEW ==="]
         for goal_name, goal_details in self.savings_goals.items():
-            print(f"\nGoal: {goal_name}")
-            print(f"Target Amount: ${goal_details['target_amount']:.2f}")
-            print(f"Time Frame: {goal_details['years']} years")
-            print(f"Annual Interest Rate: {goal_details['annual_rate'] * 100:.2f}%")
-            print(f"Monthly Investment Required: ${goal_details['monthly_investment_required']:.2f}")
+            out.append(
+                f"\nGoal: {goal_name}\n"
+                f"Target Amount: ${goal_details['target_amount']:.2f}\n"
+                f"Time Frame: {goal_details['years']} years\n"
+                f"Annual Interest Rate: {goal_details['annual_rate'] * 100:.2f}%\n"
+                f"Monthly Investment Required: ${goal_details['monthly_investment_required']:.2f}"
+            )
+        _render(out)
 
         input("\nPress Enter to continue...")
 
     def budget_summary(self):
         """Display budget summary."""
         self.clear_screen()
-        print("=== BUDGET SUMMARY ===")
+        out = ["=== BUDGET SUMMARY ==="]
 
         # Income
-        print(f"Monthly Income: ${self.income:.2f}")
+        out.append(f"Monthly Income: ${self.income:.2f}")
 
         # Expenses
         total_expenses = sum(self.expenses.values())
-        print("\nExpenses:")
+        out.append("\nExpenses:")
         for category, amount in self.expenses.items():
-            print(f"{category}: ${amount:.2f}")
-        print(f"Total Expenses: ${total_expenses:.2f}")
+            out.append(f"{category}: ${amount:.2f}")
+        out.append(f"Total Expenses: ${total_expenses:.2f}")
 
         # Remaining Budget
         remaining = self.income - total_expenses
-        print(f"\nRemaining Budget: ${remaining:.2f}")
+        out.append(f"\nRemaining Budget: ${remaining:.2f}")
+        _render(out)
 
         input("\nPress Enter to continue...")
 
@@ -226,14 +270,16 @@ class BudgetPlanner:
         """Main menu of the budget planner."""
         while True:
             self.clear_screen()
-            print("=== BUDGET PLANNER ===")
-            print("1. Add Income")
-            print("2. Add Expenses")
-            print("3. Investment Growth Projection")
-            print("4. Budget Summary")
-            print("5. Add Savings Goal")
-            print("6. View Savings Goals")
-            print("7. Exit")
+            _render([
+                "=== BUDGET PLANNER ===",
+                "1. Add Income",
+                "2. Add Expenses",
+                "3. Investment Growth Projection",
+                "4. Budget Summary",
+                "5. Add Savings Goal",
+                "6. View Savings Goals",
+                "7. Exit",
+            ])
 
             choice = input("Enter your choice (1-7): ")
 